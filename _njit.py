@@ -0,0 +1,16 @@
+"""Optional numba support.
+
+njit resolves to the real numba decorator when numba is installed and to a
+no-op passthrough otherwise, so the jitted kernels stay importable (just
+uncompiled) without numba in the environment.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
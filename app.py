@@ -1,9 +1,200 @@
-import yfinance as yf
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
 import numpy as np
 import streamlit as st
-import matplotlib.pyplot as plt
-import datetime
+
+from _njit import njit
+
+# yfinance and matplotlib are imported lazily at their use sites — both
+# carry a few hundred ms of import cost that would otherwise land on the
+# first render, before the user has even submitted a symbol.
+
+
+@njit(cache=True)
+def _simulate(monday, friday, min_close, atr, atr_multiplier, max_loss_pct, strike_pct):
+    """Sequential weekly simulation: stop-loss / strike-cap exit per week,
+    compounding capital. Compiled by numba when available."""
+    n = monday.size
+    sell_price = np.empty(n)
+    weekly_return = np.empty(n)
+    capital_path = np.empty(n)
+    stop_hit = np.empty(n, dtype=np.bool_)
+    capital = 1.0
+    for i in range(n):
+        stop_loss = max(monday[i] - atr_multiplier * atr, monday[i] * (1 - max_loss_pct))
+        strike = monday[i] * (1 + strike_pct)
+        hit = min_close[i] <= stop_loss
+        if hit:
+            sell = stop_loss
+        else:
+            sell = min(friday[i], strike)
+        ret = sell / monday[i] - 1
+        capital *= 1 + ret
+        sell_price[i] = sell
+        weekly_return[i] = ret
+        capital_path[i] = capital
+        stop_hit[i] = hit
+    return sell_price, weekly_return, capital_path, stop_hit
+
+
+@njit(cache=True)
+def _wilder_atr_last(true_range, window=14):
+    """Final Wilder-smoothed ATR value in one pass: SMA seed over the first
+    window, then the classic (atr*(n-1) + tr)/n recursion."""
+    seed = 0.0
+    for i in range(window):
+        seed += true_range[i]
+    atr = seed / window
+    for i in range(window, true_range.size):
+        atr = (atr * (window - 1) + true_range[i]) / window
+    return atr
+
+
+# Reuse Ticker objects across reruns so we don't rebuild the HTTP session
+# every time Streamlit re-executes the script.
+_ticker_cache = {}
+
+
+def get_ticker(symbol):
+    import yfinance as yf
+
+    ticker = _ticker_cache.get(symbol)
+    if ticker is None:
+        ticker = yf.Ticker(symbol)
+        _ticker_cache[symbol] = ticker
+    return ticker
+
+
+@st.cache_data(ttl=3600)
+def load_hist(symbol, days):
+    return get_ticker(symbol).history(period=f"{days}d")
+
+
+@st.cache_data(ttl=3600)
+def load_expirations(symbol):
+    return list(get_ticker(symbol).options)
+
+
+@st.cache_data(ttl=300)
+def load_option_calls(symbol, expiration):
+    # Only strike and bid are used; .copy() detaches the slice from the
+    # full chain so the rest of it can be freed.
+    return get_ticker(symbol).option_chain(expiration).calls[['strike', 'bid']].copy()
+
+
+def compute_atr(hist):
+    """Final 14-bar Wilder ATR from a raw yfinance history frame."""
+    # float32 is plenty for price levels and halves the bandwidth of the
+    # array passes; capital compounding stays float64 in the simulation.
+    high = hist['High'].to_numpy(dtype=np.float32)
+    low = hist['Low'].to_numpy(dtype=np.float32)
+    close = hist['Close'].to_numpy(dtype=np.float32)
+
+    # True range as one np.maximum.reduce over offset slices — no shifted
+    # Series, no temporary DataFrame; the first bar (no prior close)
+    # simply drops out.
+    true_range = np.maximum.reduce([
+        high[1:] - low[1:],
+        np.abs(high[1:] - close[:-1]),
+        np.abs(low[1:] - close[:-1]),
+    ])
+
+    # Wilder's smoothing — single-pass recursion for just the final value,
+    # instead of materializing a full ewm series to read its last element.
+    return float(_wilder_atr_last(true_range, 14))
+
+
+def weekly_table(hist):
+    """History reindexed with Date/Week columns, plus the per-week
+    aggregation shared by the simulation and plot sections."""
+    hist = hist.reset_index()
+    first_col_name = hist.columns[0]
+    if first_col_name != 'Date':
+        hist.rename(columns={first_col_name: 'Date'}, inplace=True)
+
+    hist['Date'] = pd.to_datetime(hist['Date'])
+
+    # Monday-anchored integer week ordinals: int64 keys take pandas' fast
+    # groupby hash path, unlike Period objects. Epoch day 0 (1970-01-01)
+    # was a Thursday, hence the +3 alignment.
+    dates = hist['Date']
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    day_ordinal = dates.to_numpy().astype('datetime64[D]').astype('int64')
+    hist['Week'] = (day_ordinal + 3) // 7
+
+    # Rows are already chronological, so sort=False skips the key sort.
+    weekly = hist.groupby('Week', sort=False).agg(
+        start_date=('Date', 'first'),
+        monday_price=('Open', 'first'),
+        friday_price=('Close', 'last'),
+        min_close=('Close', 'min'),
+        max_close=('Close', 'max'),
+        n_days=('Close', 'size'),
+    )
+    weekly = weekly[weekly['n_days'] >= 2]
+    return hist, weekly
+
+
+@st.cache_data(ttl=600)
+def prepare_history(symbol, weeks):
+    """Everything derived only from (symbol, weeks): the download, the ATR,
+    and the week table. Cached as a unit so reruns that merely move the
+    loss/multiplier/strike sliders skip straight to the simulation."""
+    hist = load_hist(symbol, weeks * 5)
+    atr = compute_atr(hist)
+    hist, weekly = weekly_table(hist)
+    return atr, hist, weekly
+
+
+def backtest(symbol, weeks, atr_multiplier, max_loss_pct, strike_pct):
+    """Headline simulation stats for one symbol, for the comparison table.
+
+    Fetches via the plain ticker cache rather than st.cache_data so it is
+    safe to call from worker threads, which carry no Streamlit context.
+    """
+    hist = get_ticker(symbol).history(period=f"{weeks * 5}d")
+    if len(hist) < 15:
+        return {'symbol': symbol, 'error': f"only {len(hist)} days of data"}
+
+    atr = compute_atr(hist)
+    _, weekly = weekly_table(hist)
+
+    monday = np.ascontiguousarray(weekly['monday_price'].to_numpy(), dtype=np.float64)
+    friday = np.ascontiguousarray(weekly['friday_price'].to_numpy(), dtype=np.float64)
+    min_close = np.ascontiguousarray(weekly['min_close'].to_numpy(), dtype=np.float64)
+
+    _, weekly_return, capital_path, stop_hit = _simulate(
+        monday, friday, min_close, float(atr), float(atr_multiplier), max_loss_pct, strike_pct
+    )
+
+    n_weeks = len(weekly_return)
+    years = n_weeks / 52 if n_weeks else 1
+    capital = capital_path[-1] if n_weeks else 1.0
+    return {
+        'symbol': symbol,
+        'weeks': n_weeks,
+        'stop_loss_weeks': int(stop_hit.sum()),
+        'cumulative_return_pct': float(np.expm1(np.log1p(weekly_return).sum())) * 100,
+        'annualized_return_pct': (capital ** (1 / years) - 1) * 100 if capital > 0 else 0.0,
+    }
+
+
+def nearest_otm_call(calls, target_strike):
+    """Closest call at or above target_strike, in one O(N) argmin pass.
+
+    Returns (row, True) for a genuine OTM strike, or the highest available
+    strike with False when the whole chain sits below target.
+    """
+    strikes = calls['strike'].to_numpy()
+    otm = strikes >= target_strike
+    if not otm.any():
+        return calls.iloc[int(strikes.argmax())], False
+    delta = np.where(otm, strikes - target_strike, np.inf)
+    return calls.iloc[int(delta.argmin())], True
+
 
 st.title("Covered Call Analysis | Risk & Reward Calculator")
 st.markdown("""
@@ -51,90 +242,73 @@ This is a practical tool to evaluate **income-focused strategies** and optimize
 """)
 
 
-# Inputs
-symbol = st.text_input("Enter Stock Symbol:", "TSLA")
-max_loss_pct = st.slider("Max % Loss Allowed:", 5, 20, 10) / 100
-atr_multiplier = st.slider("ATR Multiplier:", 1, 3, 2)
-weeks_of_history = st.slider("Weeks of history for ATR Calculation and historical data:", 4, 52, 12)
-strike_pct = st.slider("1-Week Forward Strike Price (% above Monday price):", 0.0, 5.0, 2.0) / 100
+# Inputs — collected in a form so the data fetch + simulation + plot
+# pipeline runs once per Calculate click, not on every slider tick
+with st.form("params"):
+    # Normalize up front so "tsla " and "TSLA" share cache entries
+    symbol = st.text_input("Enter Stock Symbol:", "TSLA").strip().upper()
+    max_loss_pct = st.slider("Max % Loss Allowed:", 5, 20, 10) / 100
+    atr_multiplier = st.slider("ATR Multiplier:", 1, 3, 2)
+    weeks_of_history = st.slider("Weeks of history for ATR Calculation and historical data:", 4, 52, 12)
+    strike_pct = st.slider("1-Week Forward Strike Price (% above Monday price):", 0.0, 5.0, 2.0) / 100
+    compare_input = st.text_input("Optional — compare symbols (comma-separated):", "")
+    submitted = st.form_submit_button("Calculate")
+
+if not submitted:
+    st.stop()
 
 days_of_history = weeks_of_history * 5  # ~5 trading days per week
 
-stock = yf.Ticker(symbol)
-hist = stock.history(period=f"{days_of_history}d")
+hist = load_hist(symbol, days_of_history)
 
-if len(hist) < 14:
+if len(hist) < 15:
     st.error(
         f"Not enough historical data ({len(hist)} days retrieved). "
         "Try increasing weeks or using a different stock."
     )
 else:
-    # ATR calculation
-    high_low = hist['High'] - hist['Low']
-    high_close = np.abs(hist['High'] - hist['Close'].shift())
-    low_close = np.abs(hist['Low'] - hist['Close'].shift())
-
-    ranges = pd.concat([high_low, high_close, low_close], axis=1)
-    true_range = ranges.max(axis=1)
-
-    atr = true_range.rolling(window=14).mean().iloc[-1]
+    atr, hist, weekly = prepare_history(symbol, weeks_of_history)
 
-    entry_price = stock.history(period="1d")['Close'][-1]
+    # The latest bar of hist is already the most recent close — no need for
+    # a second history(period="1d") round-trip.
+    entry_price = float(hist['Close'].iloc[-1])
     stop_loss_atr = entry_price - (atr_multiplier * atr)
     stop_loss_max = entry_price * (1 - max_loss_pct)
     stop_loss_price = max(stop_loss_atr, stop_loss_max)
 
     stop_loss_drawdown_pct = ((stop_loss_price - entry_price) / entry_price) * 100
 
-    hist = hist.reset_index()
-    first_col_name = hist.columns[0]
-    if first_col_name != 'Date':
-        hist.rename(columns={first_col_name: 'Date'}, inplace=True)
-
-    hist['Date'] = pd.to_datetime(hist['Date'])
-    hist['Week'] = hist['Date'].dt.to_period('W')
-
-    weekly_drawdowns = []
-    for week, group in hist.groupby('Week'):
-        high = group['Close'].cummax()
-        drawdown = (group['Close'] - high) / high
-        min_drawdown = drawdown.min()
-        weekly_drawdowns.append(min_drawdown)
-
-    max_weekly_drawdown_pct = min(weekly_drawdowns) * 100
+    # Per-week drawdown, fully vectorized: cummax within each week via the
+    # Cython groupby path instead of a Python loop over group frames.
+    week_cummax = hist.groupby('Week', sort=False)['Close'].cummax()
+    drawdown = hist['Close'] / week_cummax - 1
+    max_weekly_drawdown_pct = drawdown.groupby(hist['Week'], sort=False).min().min() * 100
 
     # ✅ Retrieve options chain and find closest strike for info only
-    expirations = stock.options
+    import datetime
+
+    expirations = load_expirations(symbol)
     today = datetime.datetime.now().date()
-    valid_expirations = [exp for exp in expirations if (pd.to_datetime(exp).date() - today).days >= 5]
 
-    if not valid_expirations:
+    # Expirations arrive sorted, so one vectorized parse plus a binary
+    # search replaces the per-date pd.to_datetime comprehension.
+    exp_dates = pd.to_datetime(expirations).to_numpy().astype('datetime64[D]')
+    cutoff = np.datetime64(today) + np.timedelta64(5, 'D')
+    exp_idx = int(np.searchsorted(exp_dates, cutoff))
+    chosen_exp = expirations[exp_idx] if exp_idx < len(expirations) else None
+
+    if chosen_exp is None:
         st.error("No expiration dates at least 5 days out available!")
         bid_price = 0
         strike_price_opt = None
     else:
-        chosen_exp = valid_expirations[0]
-        opt_chain = stock.option_chain(chosen_exp)
-        calls = opt_chain.calls
+        calls = load_option_calls(symbol, chosen_exp)
 
         target_strike_price = entry_price * (1 + strike_pct)
 
-        # Filter only OTM calls (strikes >= target strike)
-        otm_calls = calls[calls['strike'] >= target_strike_price]
-    
-    if not otm_calls.empty:
-        # Get the closest OTM strike above target
-        closest_call = otm_calls.sort_values('strike').iloc[0]
-        strike_price_opt = closest_call['strike']
-        bid_price = closest_call['bid']
-    else:
-        # Fallback if no OTM strikes found
-        closest_call = calls.sort_values('strike').iloc[-1]
-        strike_price_opt = closest_call['strike']
-        bid_price = closest_call['bid']
-        st.warning("No OTM call found above target. Using highest available strike as fallback.")
-
-
+        closest_call, is_otm = nearest_otm_call(calls, target_strike_price)
+        if not is_otm:
+            st.warning("No OTM call found above target. Using highest available strike as fallback.")
         strike_price_opt = closest_call['strike']
         bid_price = closest_call['bid']
 
@@ -143,47 +317,51 @@ else:
     annualized_return = (total_premium / entry_price) * (52 / weeks_of_history) * 100 if entry_price != 0 else 0
 
     # ✅ Weekly returns (always use strike_pct cap, not option strike)
-    capital = 1  # normalized starting capital = $1
-    weekly_returns = []
-
-    for week, group in hist.groupby('Week'):
-        if len(group) < 2:
-            continue
-
-        monday_price = group.iloc[0]['Open']
-        friday_price = group.iloc[-1]['Close']
+    monday = np.ascontiguousarray(weekly['monday_price'].to_numpy(), dtype=np.float64)
+    friday = np.ascontiguousarray(weekly['friday_price'].to_numpy(), dtype=np.float64)
+    min_close = np.ascontiguousarray(weekly['min_close'].to_numpy(), dtype=np.float64)
 
-        weekly_stop_loss_atr = monday_price - (atr_multiplier * atr)
-        weekly_stop_loss_max = monday_price * (1 - max_loss_pct)
-        weekly_stop_loss = max(weekly_stop_loss_atr, weekly_stop_loss_max)
+    sell_price, weekly_return, capital_path, stop_hit = _simulate(
+        monday, friday, min_close, float(atr), float(atr_multiplier), max_loss_pct, strike_pct
+    )
 
-        strike_price_week = monday_price * (1 + strike_pct)  # always use % cap
+    weekly_dollar_return = np.diff(np.concatenate(([1.0], capital_path)))
+    capital = capital_path[-1] if len(capital_path) else 1.0
+
+    # Exit dates: the first row in each week whose close breaches that
+    # week's stop level. The minimum-close day only approximates this when
+    # the stop is crossed earlier in the week and the low comes later.
+    weekly_stop_loss = np.maximum(monday - atr_multiplier * atr, monday * (1 - max_loss_pct))
+    stop_per_row = hist['Week'].map(pd.Series(weekly_stop_loss, index=weekly.index)).to_numpy()
+    breach_row = np.where(hist['Close'].to_numpy() <= stop_per_row, np.arange(len(hist)), len(hist))
+    first_hit = (
+        pd.Series(breach_row)
+        .groupby(hist['Week'].to_numpy(), sort=False)
+        .min()
+        .reindex(weekly.index)
+        .to_numpy()
+    )
+    hit_idx = np.minimum(first_hit, len(hist) - 1)  # non-hit weeks are never read
+    hit_dates = hist['Date'].dt.strftime('%Y-%m-%d').to_numpy()[hit_idx]
+    exit_reason = np.where(
+        stop_hit,
+        np.char.add("Stop-loss hit on ", hit_dates.astype(str)),
+        "Held to Friday or capped",
+    )
 
-        stop_loss_hit = group[group['Close'] <= weekly_stop_loss]
+    weekly_returns = pd.DataFrame({
+        'week': pd.to_datetime(weekly.index.to_numpy() * 7 - 3, unit='D').strftime('%Y-%m-%d'),
+        'monday_price': monday,
+        'friday_price': friday,
+        'sell_price': sell_price,
+        'weekly_return_pct': weekly_return * 100,
+        'weekly_dollar_return': weekly_dollar_return,
+        'capital_after_week': capital_path,
+        'exit_reason': exit_reason,
+    })
 
-        if not stop_loss_hit.empty:
-            sell_price = weekly_stop_loss
-            exit_reason = f"Stop-loss hit on {stop_loss_hit.iloc[0]['Date'].date()}"
-        else:
-            sell_price = min(friday_price, strike_price_week)
-            exit_reason = "Held to Friday or capped"
-
-        weekly_return = (sell_price - monday_price) / monday_price
-        weekly_dollar_return = capital * weekly_return
-        capital *= (1 + weekly_return)
-
-        weekly_returns.append({
-            'week': str(week),
-            'monday_price': monday_price,
-            'friday_price': friday_price,
-            'sell_price': sell_price,
-            'weekly_return_pct': weekly_return * 100,
-            'weekly_dollar_return': weekly_dollar_return,
-            'capital_after_week': capital,
-            'exit_reason': exit_reason
-        })
-
-    cumulative_return = capital - 1
+    # log1p/expm1 keeps precision for long chains of near-zero returns
+    cumulative_return = float(np.expm1(np.log1p(weekly_return).sum()))
 
     # ✅ Output
     st.subheader("Results")
@@ -231,86 +409,97 @@ else:
 
 
 
-    st.dataframe(pd.DataFrame(weekly_returns))
+    st.dataframe(weekly_returns)
 
     # ✅ Plot
-    fig, ax = plt.subplots(figsize=(10, 4))
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+
+    # Figure() bypasses the pyplot registry, so each rerun's figure is
+    # released with the script instead of accumulating in plt's state.
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
     ax.plot(hist['Date'], hist['Close'], label='Close Price')
     ax.set_ylabel('Price')
     ax.set_title('Price Chart with Weekly Stop-Loss Trigger Highlight (per-week recalculated)')
 
-    # ✅ Initialize counters
-    green_weeks = 0
-    red_weeks = 0
-
-    for week, group in hist.groupby('Week'):
-        if group.empty or len(group) < 2:
-            continue
-        
-        week_max = group['Close'].max()
-        week_min = group['Close'].min()
-    
-        monday_open = group.iloc[0]['Open']
-        friday_close = group.iloc[-1]['Close']
-    
-        weekly_stop_loss_atr = monday_open - (atr_multiplier * atr)
-        weekly_stop_loss_max = monday_open * (1 - max_loss_pct)
-        weekly_stop_loss = max(weekly_stop_loss_atr, weekly_stop_loss_max)
-    
-        stop_loss_triggered = (group['Close'] < weekly_stop_loss).any()
-    
-        if stop_loss_triggered:
-            color = 'red'
-            linewidth = 2.5
-            label = 'Stop-Loss Triggered (week)'
-            red_weeks += 1
-            weekly_return_pct = ((weekly_stop_loss - monday_open) / monday_open) * 100  # ✅ Define it here
-        else:
-            weekly_return_pct = ((friday_close - monday_open) / monday_open) * 100
-            if weekly_return_pct >= 0:
-                color = 'green'
-                label = 'Gain Week (no stop-loss)'
-                green_weeks += 1
-            else:
-                color = 'orange'
-                label = 'Loss Week (no stop-loss)'
-            linewidth = 1.5
-
-    
-        if ax.get_legend_handles_labels()[1].count(label) == 0:
-            ax.vlines(group['Date'].iloc[0], week_min, week_max, color=color, alpha=0.8, linewidth=linewidth, label=label)
-        else:
-            ax.vlines(group['Date'].iloc[0], week_min, week_max, color=color, alpha=0.8, linewidth=linewidth)
-    
-        # Weekly return annotation
-        try:
-            label_pos = week_max * 1.01 if weekly_return_pct >= 0 else week_min * 0.99
-            if pd.notna(label_pos) and np.isfinite(label_pos):
-                ax.annotate(
-                    f"{weekly_return_pct:+.1f}%", 
-                    xy=(group['Date'].iloc[0], label_pos),
-                    ha='center', 
-                    va='bottom' if weekly_return_pct >= 0 else 'top',
-                    fontsize=8, 
-                    color=color,
-                    rotation=0
-                )
-        except Exception as e:
-            st.warning(f"Annotation error on week {week}: {e}")
-        from matplotlib.lines import Line2D  # Add this at the top of your file if not already
-        
-        # After the loop, before ax.legend()
-        total_tracked = green_weeks + red_weeks
-        if total_tracked > 0:
-            success_ratio = green_weeks / total_tracked
-            ratio_label = f"Green/Red Weeks: {green_weeks}/{red_weeks} ({success_ratio:.0%} success)"
-            dummy_line = Line2D([0], [0], color='white', label=ratio_label)  # Invisible line for legend
-            handles, labels = ax.get_legend_handles_labels()
-            handles.append(dummy_line)
-            labels.append(ratio_label)
-            ax.legend(handles=handles, labels=labels)
-        else:
-            ax.legend()
+    # All week highlights in one LineCollection instead of one ax.vlines
+    # call per week. Stop-loss levels and hits come straight from the
+    # simulation above — no per-week recomputation or boolean probe.
+    week_min = min_close
+    week_max = weekly['max_close'].to_numpy()
+    triggered = stop_hit
+    week_return_pct = np.where(triggered, weekly_return, friday / monday - 1) * 100
+
+    colors = np.where(triggered, 'red', np.where(week_return_pct >= 0, 'green', 'orange'))
+    linewidths = np.where(triggered, 2.5, 1.5)
+
+    x = mdates.date2num(weekly['start_date'])
+    segments = np.stack([np.column_stack([x, week_min]), np.column_stack([x, week_max])], axis=1)
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidths, alpha=0.8))
+
+    # Weekly return annotations
+    for xi, lo, hi, ret, color in zip(x, week_min, week_max, week_return_pct, colors):
+        label_pos = hi * 1.01 if ret >= 0 else lo * 0.99
+        if np.isfinite(label_pos):
+            ax.annotate(
+                f"{ret:+.1f}%",
+                xy=(xi, label_pos),
+                ha='center',
+                va='bottom' if ret >= 0 else 'top',
+                fontsize=8,
+                color=color,
+            )
+
+    green_weeks = int((colors == 'green').sum())
+    red_weeks = int(triggered.sum())
+
+    # Proxy handles for the week categories (the collection itself carries
+    # no per-segment labels)
+    handles, _ = ax.get_legend_handles_labels()
+    for color, label in (
+        ('red', 'Stop-Loss Triggered (week)'),
+        ('green', 'Gain Week (no stop-loss)'),
+        ('orange', 'Loss Week (no stop-loss)'),
+    ):
+        if (colors == color).any():
+            handles.append(Line2D([0], [0], color=color, label=label))
+
+    total_tracked = green_weeks + red_weeks
+    if total_tracked > 0:
+        success_ratio = green_weeks / total_tracked
+        ratio_label = f"Green/Red Weeks: {green_weeks}/{red_weeks} ({success_ratio:.0%} success)"
+        handles.append(Line2D([0], [0], color='white', label=ratio_label))  # Invisible line for legend
+    ax.legend(handles=handles)
 
     st.pyplot(fig)
 
+# ✅ Multi-symbol comparison. Per-symbol work is dominated by the yfinance
+# download plus numpy/numba code that releases the GIL, so a thread pool
+# scales close to linearly without the pickling constraints a process pool
+# would put on a Streamlit script.
+compare_symbols = [s.strip().upper() for s in compare_input.split(',') if s.strip()]
+if compare_symbols:
+    all_symbols = [symbol] + [s for s in compare_symbols if s != symbol]
+
+    st.subheader("Symbol Comparison")
+    progress = st.progress(0.0)
+    rows = []
+    with ThreadPoolExecutor(max_workers=min(len(all_symbols), os.cpu_count() or 4)) as pool:
+        futures = {
+            pool.submit(backtest, sym, weeks_of_history, atr_multiplier, max_loss_pct, strike_pct): sym
+            for sym in all_symbols
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                rows.append({'symbol': futures[future], 'error': str(e)})
+            progress.progress(done / len(futures))
+    progress.empty()
+
+    comparison = pd.DataFrame(rows).set_index('symbol').loc[all_symbols]
+    st.dataframe(comparison)
+